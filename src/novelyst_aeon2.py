@@ -18,13 +18,16 @@ GNU General Public License for more details.
 """
 import os
 import sys
+import stat
+import time
 from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
 import tkinter as tk
 import locale
 import gettext
 import webbrowser
 from tkinter import messagebox
-from datetime import datetime
 from pywriter.pywriter_globals import *
 from pywriter.model.novel import Novel
 from pywriter.config.configuration import Configuration
@@ -35,13 +38,8 @@ from pywriter.yw.yw7_file import Yw7File
 # Initialize localization.
 LOCALE_PATH = f'{os.path.dirname(sys.argv[0])}/locale/'
 CURRENT_LANGUAGE = locale.getlocale()[0][:2]
-try:
-    t = gettext.translation('novelyst_aeon2', LOCALE_PATH, languages=[CURRENT_LANGUAGE])
-    _ = t.gettext
-except:
-
-    def _(message):
-        return message
+t = gettext.translation('novelyst_aeon2', LOCALE_PATH, languages=[CURRENT_LANGUAGE], fallback=True)
+_ = t.gettext
 
 APPLICATION = 'Aeon Timeline 2'
 PLUGIN = f'{APPLICATION} plugin v@release'
@@ -49,6 +47,25 @@ INI_FILENAME = 'aeon2yw.ini'
 INI_FILEPATH = '.pywriter/aeon2yw/config'
 
 
+@lru_cache(maxsize=1)
+def _get_plugin_cnf_dir():
+    """Return the global configuration directory, resolving the home directory only once."""
+    try:
+        homeDir = Path.home().as_posix()
+        return f'{homeDir}/{INI_FILEPATH}'
+    except:
+        return '.'
+
+
+def _get_ini_files(sourceDir):
+    """Return a tuple with the paths of the global and the local configuration file.
+    
+    Positional arguments:
+        sourceDir -- str: directory of the project.
+    """
+    return (f'{_get_plugin_cnf_dir()}/{INI_FILENAME}', f'{sourceDir}/{INI_FILENAME}')
+
+
 class Plugin():
     """Plugin class for synchronization with Aeon Timeline 2.
     
@@ -63,7 +80,7 @@ class Plugin():
     URL = 'https://peter88213.github.io/novelyst_aeon2'
     _HELP_URL = 'https://peter88213.github.io/novelyst_aeon2/usage'
 
-    SETTINGS = dict(
+    SETTINGS = MappingProxyType(dict(
         default_date_time='2023-01-01 00:00:00',
         narrative_arc='Narrative',
         property_yw7_sync='yw7sync',
@@ -80,11 +97,11 @@ class Plugin():
         color_event='Yellow',
         color_point='Blue',
 
-    )
-    OPTIONS = dict(
+    ))
+    OPTIONS = MappingProxyType(dict(
         scenes_only=True,
         add_moonphase=False,
-    )
+    ))
 
     def install(self, ui):
         """Add a submenu to the main menu.
@@ -93,6 +110,9 @@ class Plugin():
             ui -- reference to the NovelystTk instance of the application.
         """
         self._ui = ui
+        self._configCache = {}
+        self._prjPath = None
+        self._timelinePath = None
 
         # Create a submenu in the Tools menu.
         self._pluginMenu = tk.Menu(self._ui.toolsMenu, tearoff=0)
@@ -117,23 +137,33 @@ class Plugin():
         
         First, look for a global configuration file in the aeon2yw installation directory,
         then look for a local configuration file in the project directory.
+        The result is cached per project directory, and reused as long as the
+        modification time and size of the INI files are unchanged.
+        Return a copy, so the caller may modify it.
         """
         sourceDir = os.path.dirname(sourcePath)
         if not sourceDir:
             sourceDir = '.'
-        try:
-            homeDir = str(Path.home()).replace('\\', '/')
-            pluginCnfDir = f'{homeDir}/{INI_FILEPATH}'
-        except:
-            pluginCnfDir = '.'
-        iniFiles = [f'{pluginCnfDir}/{INI_FILENAME}', f'{sourceDir}/{INI_FILENAME}']
-        configuration = Configuration(self.SETTINGS, self.OPTIONS)
+        iniFiles = _get_ini_files(sourceDir)
+
+        # Reuse the parsed configuration as long as the INI files are unchanged.
+        iniStats = []
         for iniFile in iniFiles:
-            configuration.read(iniFile)
-        kwargs = {}
-        kwargs.update(configuration.settings)
-        kwargs.update(configuration.options)
-        return kwargs
+            try:
+                status = os.stat(iniFile)
+                iniStats.append((iniFile, status.st_mtime, status.st_size))
+            except OSError:
+                iniStats.append((iniFile, None, None))
+        cacheKey = tuple(iniStats)
+        cachedKey, kwargs = self._configCache.get(iniFiles, (None, None))
+        if cachedKey == cacheKey:
+            return dict(kwargs)
+
+        configuration = Configuration(self.SETTINGS, self.OPTIONS)
+        configuration.read([iniFile for iniFile, mtime, __ in iniStats if mtime is not None])
+        kwargs = {**configuration.settings, **configuration.options}
+        self._configCache[iniFiles] = (cacheKey, kwargs)
+        return dict(kwargs)
 
     def _edit_settings(self):
         """Toplevel window"""
@@ -142,15 +172,28 @@ class Plugin():
     def disable_menu(self):
         """Disable menu entries when no project is open."""
         self._ui.toolsMenu.entryconfig(APPLICATION, state='disabled')
+        self._prjPath = None
+        self._timelinePath = None
 
     def enable_menu(self):
         """Enable menu entries when a project is open."""
         self._ui.toolsMenu.entryconfig(APPLICATION, state='normal')
 
+    def _get_timeline_path(self):
+        """Return the path of the timeline file belonging to the open project.
+        
+        The path is derived only once, and again if the project file path changes.
+        """
+        prjPath = self._ui.prjFile.filePath
+        if prjPath != self._prjPath:
+            self._timelinePath = f'{os.path.splitext(prjPath)[0]}{JsonTimeline2.EXTENSION}'
+            self._prjPath = prjPath
+        return self._timelinePath
+
     def _launch_application(self):
         """Launch Aeon Timeline 2 with the current project."""
         if self._ui.prjFile:
-            timelinePath = f'{os.path.splitext(self._ui.prjFile.filePath)[0]}{JsonTimeline2.EXTENSION}'
+            timelinePath = self._get_timeline_path()
             if os.path.isfile(timelinePath):
                 if self._ui.lock():
                     open_document(timelinePath)
@@ -165,24 +208,9 @@ class Plugin():
         """
         #--- Try to get persistent configuration data
         if self._ui.prjFile:
-            timelinePath = f'{os.path.splitext(self._ui.prjFile.filePath)[0]}{JsonTimeline2.EXTENSION}'
+            timelinePath = self._get_timeline_path()
             if os.path.isfile(timelinePath):
-                sourceDir = os.path.dirname(timelinePath)
-                if not sourceDir:
-                    sourceDir = '.'
-                try:
-                    homeDir = str(Path.home()).replace('\\', '/')
-                    pluginCnfDir = f'{homeDir}/{INI_FILEPATH}'
-                except:
-                    pluginCnfDir = '.'
-                iniFiles = [f'{pluginCnfDir}/{INI_FILENAME}', f'{sourceDir}/{INI_FILENAME}']
-                configuration = Configuration(self.SETTINGS, self.OPTIONS)
-                for iniFile in iniFiles:
-                    configuration.read(iniFile)
-                kwargs = {}
-                kwargs.update(configuration.settings)
-                kwargs.update(configuration.options)
-                kwargs['add_moonphase'] = True
+                kwargs = {**self._get_config(timelinePath), 'add_moonphase': True}
                 timeline = JsonTimeline2(timelinePath, **kwargs)
                 try:
                     timeline.read()
@@ -195,15 +223,20 @@ class Plugin():
     def _info(self):
         """Show information about the Aeon Timeline 2 file."""
         if self._ui.prjFile:
-            timelinePath = f'{os.path.splitext(self._ui.prjFile.filePath)[0]}{JsonTimeline2.EXTENSION}'
-            if os.path.isfile(timelinePath):
+            timelinePath = self._get_timeline_path()
+            # Get file type and date with a single system call.
+            try:
+                status = os.stat(timelinePath)
+            except OSError:
+                status = None
+            if status is not None and stat.S_ISREG(status.st_mode):
                 try:
-                    timestamp = os.path.getmtime(timelinePath)
+                    timestamp = status.st_mtime
                     if timestamp > self._ui.prjFile.timestamp:
                         cmp = _('newer')
                     else:
                         cmp = _('older')
-                    fileDate = datetime.fromtimestamp(timestamp).replace(microsecond=0).isoformat(sep=' ')
+                    fileDate = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
                     message = _('{0} file is {1} than the novelyst project.\n (last saved on {2})').format(APPLICATION, cmp, fileDate)
                 except:
                     message = _('Cannot determine file date.')
@@ -219,7 +252,7 @@ class Plugin():
         The JsonTimeline2 target object's merge method reads from the disk.
         """
         if self._ui.prjFile:
-            timelinePath = f'{os.path.splitext(self._ui.prjFile.filePath)[0]}{JsonTimeline2.EXTENSION}'
+            timelinePath = self._get_timeline_path()
             if not os.path.isfile(timelinePath):
                 self._ui.set_info_how(_('!No {} file available for this project.').format(APPLICATION))
                 return
@@ -250,7 +283,7 @@ class Plugin():
         Re-reading the project afterwards is the safest way to get a display update.
         """
         if self._ui.prjFile:
-            timelinePath = f'{os.path.splitext(self._ui.prjFile.filePath)[0]}{JsonTimeline2.EXTENSION}'
+            timelinePath = self._get_timeline_path()
             if not os.path.isfile(timelinePath):
                 self._ui.set_info_how(_('!No {} file available for this project.').format(APPLICATION))
                 return
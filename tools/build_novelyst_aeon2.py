@@ -19,11 +19,56 @@ SRC = '../src/'
 BUILD = '../test/'
 SOURCE_FILE = f'{SRC}novelyst_aeon2.py'
 TARGET_FILE = f'{BUILD}novelyst_aeon2.py'
+# Packages to be inlined, in this order: (package name, source path)
+LIBRARIES = (
+    ('aeon2ywlib', '../../aeon2yw/src/'),
+    ('pywriter', '../../PyWriter/src/'),
+    )
+
+
+def target_is_up_to_date():
+    """Return True if the target file is newer than the script and all library modules.
+    
+    Raise FileNotFoundError if a library package is missing.
+    """
+    sourceFiles = [SOURCE_FILE]
+    for package, packagePath in LIBRARIES:
+        packageDir = f'{packagePath}{package}'
+        if not os.path.isdir(packageDir):
+            raise FileNotFoundError(f'Library package not found: "{packageDir}".')
+
+        for root, __, files in os.walk(packageDir):
+            sourceFiles.extend(f'{root}/{file}' for file in files if file.endswith('.py'))
+    try:
+        targetTime = os.stat(TARGET_FILE).st_mtime_ns
+    except OSError:
+        return False
+
+    for sourceFile in sourceFiles:
+        if os.stat(sourceFile).st_mtime_ns >= targetTime:
+            return False
+
+    return True
 
 
 def main():
-    inliner.run(SOURCE_FILE, TARGET_FILE, 'aeon2ywlib', '../../aeon2yw/src/')
-    inliner.run(TARGET_FILE, TARGET_FILE, 'pywriter', '../../PyWriter/src/')
+    if target_is_up_to_date():
+        print(f'"{TARGET_FILE}" is up to date.')
+        return
+
+    # Build into a temporary file, so a failed pass leaves no incomplete target behind.
+    tmpFile = f'{TARGET_FILE}.tmp'
+    sourceFile = SOURCE_FILE
+    try:
+        for package, packagePath in LIBRARIES:
+            inliner.run(sourceFile, tmpFile, package, packagePath)
+            sourceFile = tmpFile
+    except:
+        if os.path.isfile(tmpFile):
+            os.remove(tmpFile)
+        raise
+
+    os.replace(tmpFile, TARGET_FILE)
     print('Done.')
 
 
@@ -13,25 +13,42 @@ APP = 'novelyst_aeon2'
 POT_FILE = '../i18n/messages.pot'
 
 
+def pot_is_up_to_date(version):
+    """Return True if the pot file is newer than the plugin and has the same version."""
+    try:
+        if os.path.getmtime(POT_FILE) <= os.path.getmtime(build_plugin.TARGET_FILE):
+            return False
+
+        with open(POT_FILE, 'r', encoding='utf-8') as f:
+            header = f.read(1024)
+    except OSError:
+        return False
+
+    return f'"Project-Id-Version: {version}\\n"' in header
+
+
 def make_pot(version='unknown'):
     # Generate a complete plugin.
     build_plugin.main()
 
+    if pot_is_up_to_date(version):
+        print(f'"{POT_FILE}" is up to date.')
+        return True
+
     # Generate a pot file from the script.
-    if os.path.isfile(POT_FILE):
-        os.replace(POT_FILE, f'{POT_FILE}.bak')
-        backedUp = True
-    else:
-        backedUp = False
+    # Write it to a temporary file first, so the existing pot file is kept on failure.
+    tmpFile = f'{POT_FILE}.tmp'
     try:
-        pot = pgettext.PotFile(POT_FILE, app=APP, appVersion=version)
+        if os.path.isfile(tmpFile):
+            os.remove(tmpFile)
+        pot = pgettext.PotFile(tmpFile, app=APP, appVersion=version)
         pot.scan_file(build_plugin.TARGET_FILE)
-        print(f'Writing "{pot.filePath}"...\n')
+        print(f'Writing "{POT_FILE}"...\n')
         pot.write_pot()
-
+        os.replace(tmpFile, POT_FILE)
     except:
-        if backedUp:
-            os.replace(f'{POT_FILE}.bak', POT_FILE)
+        if os.path.isfile(tmpFile):
+            os.remove(tmpFile)
         print('WARNING: Cannot write pot file.')
         return False
 
@@ -39,9 +56,9 @@ def make_pot(version='unknown'):
 
 
 if __name__ == '__main__':
-    try:
+    if len(sys.argv) > 1:
         success = make_pot(sys.argv[1])
-    except:
+    else:
         success = make_pot()
     if not success:
         sys.exit(1)
@@ -56,7 +56,7 @@ def main(version='unknown'):
 
 
 if __name__ == '__main__':
-    try:
+    if len(sys.argv) > 1:
         main(sys.argv[1])
-    except:
+    else:
         main()